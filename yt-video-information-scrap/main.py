@@ -1,34 +1,166 @@
 import asyncio
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import time
-from typing import List, Optional
-from urllib.parse import urlparse, parse_qs
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, urlencode
 
+import anyio
+import httpx
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from playwright.async_api import async_playwright, Browser, Page
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging (use LOG_LEVEL=WARNING in production)
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler('yt_scraper.log')
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+
+# Records are queued and written by a background thread so the event loop never blocks on log I/O
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+
+# Unknown LOG_LEVEL values fall back to INFO instead of failing worker startup
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+log_level_name = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+log_level = LOG_LEVELS.get(log_level_name)
+
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('yt_scraper.log')
-    ]
+    level=log_level if log_level is not None else logging.INFO,
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
+if log_level is None:
+    logger.warning(f"Unknown LOG_LEVEL '{log_level_name}', falling back to INFO")
+
+# Maximum number of concurrent scrapes per worker (also the browser context pool size)
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "5"))
 
 # Global semaphore for concurrency limiting
-semaphore = asyncio.Semaphore(3)
+semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+# Chromium launch flags, resolved once at startup
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    # Thumbnails are derived from video IDs, so images are never downloaded
+    "--blink-settings=imagesEnabled=false"
+]
+
+# User agent applied to every browser context
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Viewport used by every browser context
+VIEWPORT = {"width": 1280, "height": 800}
+
+# Injected into every page before YouTube's scripts run; disables CSS animations and transitions
+DISABLE_ANIMATIONS_JS = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; }';
+    document.head.appendChild(style);
+}, { once: true });
+"""
+
+# Video, font, ad and analytics URLs blocked in the browser's network stack (CDP wildcard patterns).
+# Unlike a Playwright route this keeps the HTTP cache and costs no round-trip per request.
+BLOCKED_URL_PATTERNS = [
+    "*googlevideo.com*",
+    "*fonts.gstatic.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*google-analytics.com*",
+    "*/api/stats/*",
+    "*/pagead/*",
+]
+
+# In-page scraper returning title, URL, channel and thumbnail for video renderers in [start, start + max)
+EXTRACT_VIDEOS_JS = """
+([start, max]) => Array.from(document.querySelectorAll('ytd-video-renderer')).slice(start, start + max).map(el => {
+    const titleLink = el.querySelector('a#video-title');
+    const channelLink = el.querySelector('a.yt-simple-endpoint.style-scope.yt-formatted-string');
+    const img = el.querySelector('img');
+    return {
+        title: titleLink?.getAttribute('title') || '',
+        url: titleLink?.getAttribute('href') || '',
+        channelTitle: channelLink?.innerText || '',
+        thumbnail: img?.getAttribute('src') || '',
+    };
+})
+"""
+
+# All consent button variants as one selector (:has-text matches case-insensitive substrings)
+CONSENT_SELECTOR = ", ".join([
+    'button[aria-label*="Accept" i]',
+    'button[aria-label*="agree" i]',
+    'button:has-text("Accept")',
+    'button:has-text("Agree")',
+    '[role="button"]:has-text("Accept")',
+    '[role="button"]:has-text("Agree")',
+    'yt-button-renderer:has-text("Accept")',
+    'yt-button-renderer:has-text("Agree")'
+])
+
+# Number of video renderers currently in the DOM
+COUNT_VIDEOS_JS = "() => document.querySelectorAll('ytd-video-renderer').length"
+
+# Resolves once more video renderers than the given count are in the DOM
+VIDEOS_LOADED_JS = "(count) => document.querySelectorAll('ytd-video-renderer').length > count"
+
+# How long to wait for new results after a scroll before giving up
+SCROLL_LOAD_TIMEOUT_MS = 3000
+
+# Matches watch (first v= parameter in the query), embed, v/ and youtu.be URLs
+VIDEO_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?(?:[^#]*?&)??v=|embed/|v/)|youtu\.be/)([^&\n?#]+)')
+
+# Replace a pooled context after this many checkouts to release memory Chromium retains
+CONTEXT_RECYCLE_EVERY = 20
+
+# Search results data embedded in YouTube's results HTML
+YT_INITIAL_DATA_RE = re.compile(r'var ytInitialData = ({.+?});</script>', re.S)
+
+# Timeout for the plain HTTP fast path, in seconds; kept short so a fallback adds little latency
+FAST_SEARCH_TIMEOUT = 3.0
+
+# Videos the first results page holds; larger requests need scrolling and go straight to the browser
+FAST_SEARCH_MAX_RESULTS = 20
+
+# Maximum number of queries accepted by the batch endpoint
+MAX_BATCH_QUERIES = 10
+
+# Search response cache settings (a TTL of 0 disables caching)
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_MAX_ENTRIES = 256
 
 # Pydantic models
 class VideoInfo(BaseModel):
@@ -41,11 +173,27 @@ class SearchResponse(BaseModel):
     videos: List[VideoInfo]
     total_results: int
 
+class SearchBatchRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES, description="Search terms")
+    maxResults: int = Field(10, ge=1, le=50, description="Maximum number of results per query (1-50)")
+    hl: str = Field("en", description="Language code")
+    gl: str = Field("US", description="Country code")
+
+class SearchBatchResult(BaseModel):
+    query: str
+    videos: List[VideoInfo] = []
+    total_results: int = 0
+    error: Optional[str] = None
+
+class SearchBatchResponse(BaseModel):
+    results: List[SearchBatchResult]
+
 # FastAPI app
 app = FastAPI(
     title="YouTube Search Scraper",
     description="A FastAPI service that scrapes YouTube search results using Playwright",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -58,72 +206,128 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global browser instance
+# Global playwright and browser instances
+playwright: Optional[Playwright] = None
 browser: Optional[Browser] = None
 
-async def ensure_playwright() -> Browser:
-    """Initialize and return a browser instance"""
-    global browser
-    if browser is None:
-        logger.info("Initializing Playwright browser...")
-        start_time = time.time()
-        
-        playwright = await async_playwright().start()
-        logger.info("Playwright started successfully")
-        
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor"
-            ]
-        )
-        
-        init_time = time.time() - start_time
-        logger.info(f"Chromium browser launched successfully in {init_time:.2f}s")
-    else:
-        logger.info("Using existing browser instance")
+# Cached search responses keyed by normalized search parameters, with their expiry time
+search_cache: "OrderedDict[str, Tuple[float, SearchResponse]]" = OrderedDict()
+
+# Shared HTTP client for the fast search path
+http_client: Optional[httpx.AsyncClient] = None
+
+# Pool of pre-warmed browser contexts, stored with their checkout count
+context_pool: "asyncio.Queue[Tuple[BrowserContext, int]]" = asyncio.Queue(maxsize=MAX_CONCURRENCY)
+
+async def start_browser() -> Browser:
+    """Start Playwright and launch the shared Chromium browser"""
+    global playwright, browser
+    logger.info("Initializing Playwright browser...")
+    start_time = time.time()
+    
+    playwright = await async_playwright().start()
+    logger.info("Playwright started successfully")
+    
+    browser = await playwright.chromium.launch(
+        headless=True,
+        chromium_sandbox=False,
+        args=BROWSER_ARGS
+    )
+    
+    init_time = time.time() - start_time
+    logger.info(f"Chromium browser launched successfully in {init_time:.2f}s")
     return browser
 
+async def block_heavy_urls(page: Page) -> None:
+    """Block video, font and tracking URLs for a page via CDP"""
+    cdp_session = await page.context.new_cdp_session(page)
+    await cdp_session.send("Network.enable")
+    await cdp_session.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+async def create_context(browser: Browser) -> BrowserContext:
+    """Create a browser context configured for YouTube scraping"""
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        locale="en-US",
+        viewport=VIEWPORT,
+        reduced_motion="reduce"
+    )
+    await context.add_init_script(DISABLE_ANIMATIONS_JS)
+    return context
+
+async def init_context_pool() -> None:
+    """Launch the browser and fill the context pool"""
+    browser = await start_browser()
+    logger.info(f"Creating {MAX_CONCURRENCY} pooled browser contexts...")
+    while not context_pool.full():
+        context = await create_context(browser)
+        context_pool.put_nowait((context, 0))
+    logger.info("Browser context pool ready")
+
+async def release_context(context: BrowserContext, uses: int) -> None:
+    """Return a context to the pool, replacing it once it has been used enough.
+    
+    A context always goes back to the pool, even if the replacement fails or is cancelled;
+    the old context is kept when no replacement was made.
+    """
+    pooled = (context, uses)
+    try:
+        if uses >= CONTEXT_RECYCLE_EVERY and browser is not None:
+            try:
+                fresh_context = await create_context(browser)
+            except Exception as e:
+                logger.warning(f"Error creating replacement browser context: {e}")
+            else:
+                pooled = (fresh_context, 0)
+                logger.info(f"Recycling browser context after {uses} uses...")
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Error closing browser context: {e}")
+    finally:
+        context_pool.put_nowait(pooled)
+
+@asynccontextmanager
+async def context_pool_acquire() -> AsyncIterator[BrowserContext]:
+    """Check out a pooled browser context for the duration of a scrape"""
+    async with semaphore:
+        context, uses = await context_pool.get()
+        try:
+            yield context
+        finally:
+            # Shielded so a cancelled request (e.g. a dropped stream) still returns its context
+            with anyio.CancelScope(shield=True):
+                await release_context(context, uses + 1)
+
 async def handle_consent(page: Page) -> None:
     """Handle consent banners and cookie dialogs"""
     logger.info("Checking for consent banners...")
     try:
-        # Common consent button selectors
-        consent_selectors = [
-            'button[aria-label*="Accept"]',
-            'button[aria-label*="I agree"]',
-            'button:has-text("Accept all")',
-            'button:has-text("I agree")',
-            'button:has-text("Accept")',
-            'button:has-text("Agree")',
-            '[role="button"]:has-text("Accept")',
-            '[role="button"]:has-text("I agree")',
-            'yt-button-renderer:has-text("Accept")',
-            'yt-button-renderer:has-text("I agree")'
-        ]
+        consent_button = page.locator(CONSENT_SELECTOR).first
+        results = page.locator('ytd-video-renderer').first
         
-        consent_found = False
-        for i, selector in enumerate(consent_selectors):
-            try:
-                logger.debug(f"Trying consent selector {i+1}/{len(consent_selectors)}: {selector}")
-                consent_button = await page.wait_for_selector(selector, timeout=2000)
-                if consent_button:
-                    logger.info(f"Found consent button with selector: {selector}")
-                    await consent_button.click()
-                    logger.info("Clicked consent button successfully")
-                    await page.wait_for_timeout(1000)
-                    consent_found = True
-                    break
-            except Exception as e:
-                logger.debug(f"Consent selector {selector} not found: {e}")
-                continue
+        # Wait for whichever shows up first: a consent button or the search results
+        try:
+            await consent_button.or_(results).first.wait_for(state='attached', timeout=10000)
+        except PlaywrightTimeoutError:
+            logger.warning("Neither consent banner nor search results appeared")
+            return
         
-        if not consent_found:
+        if await consent_button.count() == 0:
             logger.info("No consent banners found")
+            return
+        
+        try:
+            await consent_button.click(timeout=1500)
+        except PlaywrightTimeoutError:
+            logger.info("Consent button present but not clickable, continuing")
+            return
+        
+        logger.info("Clicked consent button successfully")
+        try:
+            await results.wait_for(state='attached', timeout=10000)
+        except PlaywrightTimeoutError:
+            logger.warning("Search results did not appear after accepting consent")
                 
     except Exception as e:
         logger.warning(f"Error handling consent banners: {e}")
@@ -132,194 +336,409 @@ async def handle_consent(page: Page) -> None:
 
 def extract_video_id_from_url(url: str) -> Optional[str]:
     """Extract video ID from YouTube URL"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-        r'youtube\.com\/v\/([^&\n?#]+)',
-        r'youtube\.com\/watch\?.*v=([^&\n?#]+)'
-    ]
+    match = VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+async def extract_videos_from_page(page: Page, max_results: int, start_index: int = 0) -> Tuple[List[VideoInfo], int]:
+    """Extract video information from the current page, skipping the first start_index renderers.
     
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
-
-async def extract_videos_from_page(page: Page, max_results: int) -> List[VideoInfo]:
-    """Extract video information from the current page"""
-    logger.info(f"Extracting videos from current page (max: {max_results})")
+    Returns the extracted videos and the number of renderers scanned.
+    """
+    logger.info(f"Extracting videos from current page (max: {max_results}, start: {start_index})")
     videos = []
     
     # Wait for video elements to load
     logger.debug("Waiting for ytd-video-renderer elements to load...")
     await page.wait_for_selector('ytd-video-renderer', timeout=10000)
     
-    # Get all video renderer elements
-    video_elements = await page.query_selector_all('ytd-video-renderer')
-    logger.info(f"Found {len(video_elements)} video elements on page")
+    # Scrape the new video renderers in a single round-trip
+    raw_videos = await page.evaluate(EXTRACT_VIDEOS_JS, [start_index, max_results])
+    logger.info(f"Found {len(raw_videos)} new video elements on page")
     
-    for i, element in enumerate(video_elements):
-        if len(videos) >= max_results:
-            logger.debug(f"Reached max results limit ({max_results}), stopping extraction")
-            break
-            
-        try:
-            logger.debug(f"Processing video element {i+1}/{len(video_elements)}")
-            
-            # Extract title
-            title_element = await element.query_selector('a#video-title')
-            title = ""
-            url = ""
-            if title_element:
-                title = await title_element.get_attribute('title') or ""
-                url = await title_element.get_attribute('href') or ""
-                if url and not url.startswith('http'):
-                    url = f"https://www.youtube.com{url}"
-            
-            # Extract channel name
-            channel_element = await element.query_selector('a.yt-simple-endpoint.style-scope.yt-formatted-string')
-            channel_title = ""
-            if channel_element:
-                channel_title = await channel_element.inner_text() or ""
-            
-            # Extract thumbnail
-            thumbnail_element = await element.query_selector('img')
-            thumbnail = ""
-            if thumbnail_element:
-                thumbnail = await thumbnail_element.get_attribute('src') or ""
-            
-            # If thumbnail is missing or is a data URL, derive from video ID
-            if not thumbnail or thumbnail.startswith('data:'):
-                video_id = extract_video_id_from_url(url)
-                if video_id:
-                    thumbnail = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+    # Per-element logging is skipped entirely unless DEBUG is enabled
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    for i, raw in enumerate(raw_videos, start=start_index):
+        title = raw["title"]
+        url = raw["url"]
+        channel_title = raw["channelTitle"]
+        thumbnail = raw["thumbnail"]
+        
+        if url and not url.startswith('http'):
+            url = f"https://www.youtube.com{url}"
+        
+        # If thumbnail is missing or is a data URL, derive from video ID
+        if not thumbnail or thumbnail.startswith('data:'):
+            video_id = extract_video_id_from_url(url)
+            if video_id:
+                thumbnail = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+                if debug_enabled:
                     logger.debug(f"Generated thumbnail URL for video ID: {video_id}")
-            
-            # Only add if we have essential data
-            if title and url:
-                videos.append(VideoInfo(
-                    title=title,
-                    url=url,
-                    thumbnail=thumbnail,
-                    channelTitle=channel_title
-                ))
+        
+        # Only add if we have essential data (fields are always strings, so validation is skipped)
+        if title and url:
+            videos.append(VideoInfo.model_construct(
+                title=title,
+                url=url,
+                thumbnail=thumbnail,
+                channelTitle=channel_title
+            ))
+            if debug_enabled:
                 logger.debug(f"Successfully extracted video: '{title[:50]}...' by {channel_title}")
-            else:
-                logger.warning(f"Skipping video element {i+1}: missing title or URL")
-                
-        except Exception as e:
-            logger.error(f"Error extracting video info from element {i+1}: {e}")
-            continue
+        elif debug_enabled:
+            logger.debug(f"Skipping video element {i+1}: missing title or URL")
     
     logger.info(f"Successfully extracted {len(videos)} videos from page")
-    return videos
+    return videos, len(raw_videos)
 
-async def scroll_and_load_videos(page: Page, max_results: int) -> List[VideoInfo]:
-    """Scroll the page incrementally to load more videos"""
+async def iter_scrolled_videos(page: Page, max_results: int) -> AsyncIterator[VideoInfo]:
+    """Scroll the page incrementally, yielding each new video as soon as it is extracted"""
     logger.info(f"Starting scroll and load process for {max_results} videos")
-    all_videos = []
+    found_count = 0
+    seen_urls = set()
+    processed = 0
     scroll_attempts = 0
     max_scroll_attempts = 10
     
-    while len(all_videos) < max_results and scroll_attempts < max_scroll_attempts:
-        logger.info(f"Scroll attempt {scroll_attempts + 1}/{max_scroll_attempts} - Current videos: {len(all_videos)}")
-        
-        # Extract videos from current view
-        current_videos = await extract_videos_from_page(page, max_results)
+    # The initial view is extracted before any scrolling; the loop only scrolls when more videos are needed
+    while True:
+        # Extract only the videos loaded since the previous pass
+        current_videos, scanned = await extract_videos_from_page(page, max_results - found_count, processed)
+        processed += scanned
         logger.info(f"Extracted {len(current_videos)} videos from current view")
         
-        # Add new videos (avoid duplicates)
+        # Yield new videos (avoid duplicates)
         new_videos_count = 0
         for video in current_videos:
-            if not any(v.url == video.url for v in all_videos):
-                all_videos.append(video)
+            if video.url not in seen_urls and found_count < max_results:
+                seen_urls.add(video.url)
+                found_count += 1
                 new_videos_count += 1
+                yield video
         
-        logger.info(f"Added {new_videos_count} new videos (total: {len(all_videos)})")
+        logger.info(f"Added {new_videos_count} new videos (total: {found_count})")
         
         # If we have enough videos, break
-        if len(all_videos) >= max_results:
+        if found_count >= max_results:
             logger.info(f"Reached target of {max_results} videos, stopping scroll")
             break
+        
+        if scroll_attempts >= max_scroll_attempts:
+            logger.warning(f"Reached maximum scroll attempts ({max_scroll_attempts})")
+            break
             
-        # Scroll down to load more content
-        logger.debug("Scrolling down to load more content...")
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await page.wait_for_timeout(2000)  # Wait for new content to load
-        logger.debug("Scroll completed, waiting for content to load...")
+        # Scroll down only when every rendered video has been processed
+        rendered_count = await page.evaluate(COUNT_VIDEOS_JS)
+        if rendered_count <= processed:
+            scroll_attempts += 1
+            logger.info(f"Scroll attempt {scroll_attempts}/{max_scroll_attempts} - Current videos: {found_count}")
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                # Wait until new video renderers are attached instead of sleeping
+                await page.wait_for_function(VIDEOS_LOADED_JS, arg=rendered_count, timeout=SCROLL_LOAD_TIMEOUT_MS)
+                logger.debug("Scroll completed, new content loaded")
+            except PlaywrightTimeoutError:
+                logger.info(f"No new videos loaded within {SCROLL_LOAD_TIMEOUT_MS}ms after scrolling, stopping")
+                break
+    
+    logger.info(f"Scroll and load completed. Final result: {found_count} videos")
+
+async def scroll_and_load_videos(page: Page, max_results: int) -> List[VideoInfo]:
+    """Scroll the page incrementally to load more videos"""
+    return [video async for video in iter_scrolled_videos(page, max_results)]
+
+def build_search_url(q: str, hl: str, gl: str) -> str:
+    """Build the YouTube results URL for a query"""
+    return f"https://www.youtube.com/results?{urlencode({'search_query': q, 'hl': hl, 'gl': gl})}"
+
+def parse_initial_data_videos(data: Dict[str, Any], max_results: int) -> List[VideoInfo]:
+    """Collect videos from the ytInitialData of a results page"""
+    videos = []
+    sections = data["contents"]["twoColumnSearchResultsRenderer"]["primaryContents"]["sectionListRenderer"]["contents"]
+    for section in sections:
+        for item in section.get("itemSectionRenderer", {}).get("contents", []):
+            renderer = item.get("videoRenderer")
+            if not renderer or not renderer.get("videoId"):
+                continue
+            
+            video_id = renderer["videoId"]
+            title = "".join(run.get("text", "") for run in renderer.get("title", {}).get("runs", []))
+            owner_runs = renderer.get("ownerText", {}).get("runs", [])
+            thumbnails = renderer.get("thumbnail", {}).get("thumbnails", [])
+            thumbnail = thumbnails[-1].get("url", "") if thumbnails else ""
+            
+            if not title:
+                continue
+            videos.append(VideoInfo.model_construct(
+                title=title,
+                url=f"https://www.youtube.com/watch?v={video_id}",
+                thumbnail=thumbnail or f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+                channelTitle=owner_runs[0].get("text", "") if owner_runs else ""
+            ))
+            if len(videos) >= max_results:
+                return videos
+    return videos
+
+async def fast_search(q: str, max_results: int, hl: str, gl: str) -> Optional[List[VideoInfo]]:
+    """Search YouTube with a single HTTP request by parsing the embedded ytInitialData.
+    
+    Returns None when the page cannot be parsed (consent interstitial, layout change)
+    or does not hold enough results, so the caller can fall back to the browser.
+    """
+    if http_client is None:
+        return None
+    
+    if max_results > FAST_SEARCH_MAX_RESULTS:
+        logger.info(f"Fast search skipped: {max_results} videos exceed the first results page")
+        return None
+    
+    try:
+        response = await http_client.get(
+            build_search_url(q, hl, gl),
+            headers={"User-Agent": USER_AGENT, "Accept-Language": hl}
+        )
+        response.raise_for_status()
+        
+        match = YT_INITIAL_DATA_RE.search(response.text)
+        if not match:
+            logger.info("Fast search: ytInitialData not found, falling back to browser")
+            return None
         
-        scroll_attempts += 1
+        videos = parse_initial_data_videos(orjson.loads(match.group(1)), max_results)
+    except Exception as e:
+        logger.info(f"Fast search unavailable, falling back to browser: {e}")
+        return None
     
-    if scroll_attempts >= max_scroll_attempts:
-        logger.warning(f"Reached maximum scroll attempts ({max_scroll_attempts})")
+    if len(videos) < max_results:
+        logger.info(f"Fast search found {len(videos)}/{max_results} videos, falling back to browser")
+        return None
     
-    final_videos = all_videos[:max_results]
-    logger.info(f"Scroll and load completed. Final result: {len(final_videos)} videos")
-    return final_videos
+    logger.info(f"Fast search returned {len(videos)} videos without the browser")
+    return videos
 
-@app.get("/search", response_model=SearchResponse)
-async def search_youtube(
-    q: str = Query(..., description="Search term"),
-    maxResults: int = Query(10, ge=1, le=50, description="Maximum number of results (1-50)"),
-    hl: str = Query("en", description="Language code"),
-    gl: str = Query("US", description="Country code")
-):
-    """Search YouTube for videos and return results"""
+async def load_search_page(page: Page, q: str, hl: str, gl: str) -> None:
+    """Open the YouTube results page for a query and dismiss consent banners"""
+    await block_heavy_urls(page)
+    
+    # Construct search URL
+    search_url = build_search_url(q, hl, gl)
+    logger.info(f"Navigating to: {search_url}")
+    
+    # Navigate to YouTube search page (it never reaches network idle; results are awaited by selector)
+    await page.goto(search_url, wait_until="domcontentloaded")
+    logger.info("Successfully navigated to YouTube search page")
     
-    logger.info(f"Starting YouTube search: query='{q}', maxResults={maxResults}, hl={hl}, gl={gl}")
+    # Handle consent banners
+    await handle_consent(page)
+
+async def close_page(page: Optional[Page]) -> None:
+    """Close a browser page, logging instead of raising on failure"""
+    if page is None:
+        return
+    logger.info("Closing browser page...")
+    # Shielded so the page is closed even when the request is being cancelled
+    with anyio.CancelScope(shield=True):
+        try:
+            await page.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser page: {e}")
+
+def search_cache_key(q: str, max_results: int, hl: str, gl: str) -> str:
+    """Build the cache key for a search, ignoring query case and surrounding whitespace"""
+    return f"{q.strip().lower()}|{hl.lower()}|{gl.upper()}|{max_results}"
+
+def get_cached_search(key: str) -> Optional[SearchResponse]:
+    """Return a cached search response if it has not expired"""
+    entry = search_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at < time.monotonic():
+        del search_cache[key]
+        return None
+    return response
+
+def store_cached_search(key: str, response: SearchResponse) -> None:
+    """Cache a search response, evicting the oldest entries beyond the size limit"""
+    # Empty results usually mean a transient failure (consent wall, throttling) and must not be replayed
+    if CACHE_TTL_SECONDS <= 0 or not response.videos:
+        return
+    search_cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, response)
+    search_cache.move_to_end(key)
+    while len(search_cache) > CACHE_MAX_ENTRIES:
+        search_cache.popitem(last=False)
+
+async def lookup_search(q: str, max_results: int, hl: str, gl: str) -> Optional[SearchResponse]:
+    """Answer a search without the browser, from the cache or the HTTP fast path"""
     start_time = time.time()
     
-    async with semaphore:
+    # Serve repeated searches from the cache without touching the browser
+    cache_key = search_cache_key(q, max_results, hl, gl)
+    cached_response = get_cached_search(cache_key)
+    if cached_response is not None:
+        logger.info(f"Cache hit for query='{q}', returning {cached_response.total_results} videos")
+        return cached_response
+    
+    # Try a plain HTTP request to the results page before using the browser
+    fast_videos = await fast_search(q, max_results, hl, gl)
+    if fast_videos is None:
+        return None
+    
+    total_time = time.time() - start_time
+    logger.info(f"Search completed via fast path in {total_time:.2f}s. Found {len(fast_videos)} videos")
+    response = SearchResponse.model_construct(
+        videos=fast_videos,
+        total_results=len(fast_videos)
+    )
+    store_cached_search(cache_key, response)
+    return response
+
+def ensure_browser_ready() -> None:
+    """Fail with 503 when the browser and context pool are not up yet"""
+    # The browser and context pool are created at startup
+    if browser is None:
+        raise HTTPException(status_code=503, detail="Browser is not ready")
+
+async def scrape_search(q: str, max_results: int, hl: str, gl: str) -> SearchResponse:
+    """Run a single YouTube search, using a pooled browser context when needed"""
+    
+    logger.info(f"Starting YouTube search: query='{q}', maxResults={max_results}, hl={hl}, gl={gl}")
+    start_time = time.time()
+    
+    response = await lookup_search(q, max_results, hl, gl)
+    if response is not None:
+        return response
+    
+    ensure_browser_ready()
+    cache_key = search_cache_key(q, max_results, hl, gl)
+    
+    async with context_pool_acquire() as context:
+        page = None
         try:
-            logger.info("Acquired semaphore, starting scraping process...")
-            
-            # Get browser instance
-            browser = await ensure_playwright()
+            logger.info("Acquired browser context, starting scraping process...")
             
             # Create new page
             logger.info("Creating new browser page...")
-            page = await browser.new_page()
-            
-            # Set user agent to avoid detection
-            logger.debug("Setting user agent headers...")
-            await page.set_extra_http_headers({
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            })
-            
-            # Construct search URL
-            search_url = f"https://www.youtube.com/results?search_query={q}&hl={hl}&gl={gl}"
-            logger.info(f"Navigating to: {search_url}")
-            
-            # Navigate to YouTube search page
-            await page.goto(search_url, wait_until="networkidle")
-            logger.info("Successfully navigated to YouTube search page")
-            
-            # Handle consent banners
-            await handle_consent(page)
-            
-            # Wait a bit for the page to stabilize
-            logger.debug("Waiting for page to stabilize...")
-            await page.wait_for_timeout(2000)
+            page = await context.new_page()
+            await load_search_page(page, q, hl, gl)
             
             # Scroll and extract videos
             logger.info("Starting video extraction process...")
-            videos = await scroll_and_load_videos(page, maxResults)
-            
-            # Close the page
-            logger.info("Closing browser page...")
-            await page.close()
+            videos = await scroll_and_load_videos(page, max_results)
             
             total_time = time.time() - start_time
             logger.info(f"Search completed successfully in {total_time:.2f}s. Found {len(videos)} videos")
             
-            return SearchResponse(
+            response = SearchResponse.model_construct(
                 videos=videos,
                 total_results=len(videos)
             )
+            store_cached_search(cache_key, response)
+            return response
             
         except Exception as e:
             total_time = time.time() - start_time
             logger.error(f"Error during YouTube scraping after {total_time:.2f}s: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error scraping YouTube: {str(e)}")
+        
+        finally:
+            # Close the page; the context goes back to the pool
+            await close_page(page)
+
+async def stream_videos(videos: List[VideoInfo]) -> AsyncIterator[bytes]:
+    """Yield already available videos as JSON lines"""
+    for video in videos:
+        yield orjson.dumps(video.model_dump()) + b"\n"
+
+async def stream_search(q: str, max_results: int, hl: str, gl: str) -> AsyncIterator[bytes]:
+    """Scrape a YouTube search in the browser, yielding each video as a JSON line as soon as it is scraped"""
+    
+    logger.info(f"Starting YouTube stream search: query='{q}', maxResults={max_results}, hl={hl}, gl={gl}")
+    start_time = time.time()
+    cache_key = search_cache_key(q, max_results, hl, gl)
+    
+    async with context_pool_acquire() as context:
+        page = None
+        videos = []
+        try:
+            logger.info("Acquired browser context, starting streaming scrape...")
+            page = await context.new_page()
+            await load_search_page(page, q, hl, gl)
+            
+            async for video in iter_scrolled_videos(page, max_results):
+                videos.append(video)
+                yield orjson.dumps(video.model_dump()) + b"\n"
+            
+            total_time = time.time() - start_time
+            logger.info(f"Stream search completed successfully in {total_time:.2f}s. Found {len(videos)} videos")
+            store_cached_search(cache_key, SearchResponse.model_construct(
+                videos=videos,
+                total_results=len(videos)
+            ))
+            
+        except Exception as e:
+            # The status line has already been sent, so the failure is reported as a final line
+            total_time = time.time() - start_time
+            logger.error(f"Error during YouTube stream scraping after {total_time:.2f}s: {str(e)}")
+            yield orjson.dumps({"error": f"Error scraping YouTube: {str(e)}"}) + b"\n"
+        
+        finally:
+            await close_page(page)
+
+# Routes return ORJSONResponse directly so FastAPI does not re-validate the response;
+# the models are still published in the OpenAPI schema through `responses`
+@app.get("/search", responses={200: {"model": SearchResponse}})
+async def search_youtube(
+    q: str = Query(..., description="Search term"),
+    maxResults: int = Query(10, ge=1, le=50, description="Maximum number of results (1-50)"),
+    hl: str = Query("en", description="Language code"),
+    gl: str = Query("US", description="Country code")
+):
+    """Search YouTube for videos and return results"""
+    response = await scrape_search(q, maxResults, hl, gl)
+    return ORJSONResponse(content=response.model_dump())
+
+@app.get("/search_stream")
+async def search_youtube_stream(
+    q: str = Query(..., description="Search term"),
+    maxResults: int = Query(10, ge=1, le=50, description="Maximum number of results (1-50)"),
+    hl: str = Query("en", description="Language code"),
+    gl: str = Query("US", description="Country code")
+):
+    """Search YouTube and stream videos as newline-delimited JSON while the page scrolls"""
+    # Cache and fast-path hits need no browser, same as /search
+    response = await lookup_search(q, maxResults, hl, gl)
+    if response is not None:
+        return StreamingResponse(stream_videos(response.videos), media_type="application/x-ndjson")
+    
+    # Fail before the stream starts so the client still gets a proper status code
+    ensure_browser_ready()
+    return StreamingResponse(stream_search(q, maxResults, hl, gl), media_type="application/x-ndjson")
+
+@app.post("/search_batch", responses={200: {"model": SearchBatchResponse}})
+async def search_youtube_batch(request: SearchBatchRequest):
+    """Search YouTube for several terms concurrently across pooled browser contexts"""
+    logger.info(f"Starting YouTube batch search for {len(request.queries)} queries")
+    # Failures are collected per query so one bad search neither fails the batch nor orphans the others
+    outcomes = await asyncio.gather(*[
+        scrape_search(q, request.maxResults, request.hl, request.gl)
+        for q in request.queries
+    ], return_exceptions=True)
+    
+    results = []
+    for q, outcome in zip(request.queries, outcomes):
+        if isinstance(outcome, BaseException):
+            error = outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
+            logger.warning(f"Batch query '{q}' failed: {error}")
+            results.append(SearchBatchResult.model_construct(query=q, videos=[], total_results=0, error=error))
+        else:
+            results.append(SearchBatchResult.model_construct(
+                query=q,
+                videos=outcome.videos,
+                total_results=outcome.total_results,
+                error=None
+            ))
+    return ORJSONResponse(content=SearchBatchResponse.model_construct(results=results).model_dump())
 
 @app.get("/health")
 async def health_check():
@@ -331,16 +750,36 @@ async def health_check():
 async def startup_event():
     """Application startup event"""
     logger.info("YouTube Scraper API starting up...")
+    global http_client
+    http_client = httpx.AsyncClient(timeout=FAST_SEARCH_TIMEOUT)
+    await init_context_pool()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up browser on shutdown"""
     logger.info("YouTube Scraper API shutting down...")
-    global browser
+    global playwright, browser, http_client
+    if http_client:
+        await http_client.aclose()
+        http_client = None
+    while not context_pool.empty():
+        context, _ = context_pool.get_nowait()
+        await context.close()
     if browser:
         logger.info("Closing browser instance...")
         await browser.close()
         logger.info("Browser closed successfully")
+    if playwright:
+        await playwright.stop()
+    log_listener.stop()
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker process launches its own browser and context pool
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WORKERS", "4")),
+        loop="uvloop",
+        http="httptools"
+    )